@@ -14,18 +14,48 @@ Config priority:
 New env knobs:
 - ICKA_BATCH_SIZE            (default 5)
 - ICKA_BATCH_SLEEP_SECONDS   (default 300)
+- ICKA_SESSION_CACHE         (default ~/.cache/icka/sessions.json)
+- ICKA_PROCESSES             (default 1)
+- ICKA_HTTP2                 (default false)
+- ICKA_SKIP_WS_VERIFY        (default false)
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
 import os
+import random
+import socket
+import ssl
 import sys
+import threading
 import time
-from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterator, List, Set, Tuple, Optional
+
+# requests and websocket-client are imported where they are first used, so
+# --help and config errors don't pay for loading them.
+if TYPE_CHECKING:
+    import requests
+    import websocket  # pip install websocket-client
+    from requests.adapters import HTTPAdapter
+
+try:  # optional: pip install orjson
+    import orjson
+
+    _loads = orjson.loads
 
-import requests
-import websocket  # pip install websocket-client
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -34,6 +64,19 @@ DEFAULT_USER_AGENT = (
 
 ENV_PREFIX = "ICKA_"
 
+log = logging.getLogger("icka")
+
+
+class _AccountLog(logging.LoggerAdapter):
+    """Prefixes every message with "(email) ", formatted once per account."""
+
+    def __init__(self, logger: logging.Logger, email: str) -> None:
+        super().__init__(logger, None)
+        self._prefix = f"({email}) "
+
+    def process(self, msg, kwargs):
+        return self._prefix + msg, kwargs
+
 
 # ---------------------------------------------------------------------
 # Tiny .env + env helpers
@@ -51,18 +94,15 @@ def load_dotenv(path: str = ".env") -> None:
         return
 
     with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
+        for raw in f:
+            line = raw.strip()
+            if not line or line[0] == "#":
                 continue
-            if "=" not in line:
+            key, sep, value = line.partition("=")
+            if not sep:
                 continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
             # don't overwrite real env
-            if key not in os.environ:
-                os.environ[key] = value
+            os.environ.setdefault(key.rstrip(), value.lstrip())
 
 
 def env_get(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -91,52 +131,394 @@ def env_int(key: str, default: int) -> int:
 # ---------------------------------------------------------------------
 
 
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def _build_adapter(pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> HTTPAdapter:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            # 429 is handled in http_request, with jitter
+            status_forcelist=(500, 502, 503, 504),
+        ),
+    )
+
+
+def _build_session() -> requests.Session:
+    """
+    One process-wide Session so every account reuses the same keep-alive
+    HTTPS connections to api-3/www.irccloud.com instead of paying a fresh
+    TCP+TLS handshake per request.
+    """
+    import http.cookiejar
+
+    import requests
+
+    session = requests.Session()
+    # accounts must never see each other's cookies; we only ever use the
+    # session value returned in the login JSON body
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    session.headers["User-Agent"] = DEFAULT_USER_AGENT
+    session.mount("https://", _build_adapter())
+    return session
+
+
+# Built on first use by _get_session()
+_SESSION: Optional[requests.Session] = None
+
+# Set by enable_http2(); when present it replaces _SESSION for API calls
+_HTTP2_CLIENT = None
+
+
+def enable_http2(user_agent: str) -> bool:
+    """
+    Route http_request through an HTTP/2 httpx client, so a whole batch
+    multiplexes its POSTs over one connection per IRCCloud host.
+    Optional: needs `pip install 'httpx[http2]'`; returns False without it.
+    """
+    global _HTTP2_CLIENT
+    try:
+        import h2  # noqa: F401  (required by httpx for http2=True)
+        import httpx
+    except ImportError:
+        return False
+
+    import http.cookiejar
+
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+    client = httpx.Client(
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+        timeout=20,
+        headers={"User-Agent": user_agent},
+    )
+    # same as _SESSION: never carry cookies between accounts
+    client.cookies.jar.set_policy(
+        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+    _HTTP2_CLIENT = client
+    return True
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _build_session()
+    return _SESSION
+
+
+def _http_client():
+    return _HTTP2_CLIENT if _HTTP2_CLIENT is not None else _get_session()
+
+
+WARM_UP_URLS = ("https://api-3.irccloud.com/", "https://www.irccloud.com/")
+
+# Per host; the warm-up is best effort and must never delay batch 1 much
+WARM_UP_TIMEOUT_SECONDS = 2.0
+
+
+def warm_up_connections(
+    accounts: List[Tuple[str, str]], cache: Optional[SessionCache] = None
+) -> None:
+    """
+    Open the keep-alive connections to both IRCCloud API hosts before the
+    first batch so its accounts don't pay the cold TCP+TLS handshake.
+
+    Skipped when every account has a cached session (no HTTP will happen)
+    and under --http2, where httpx retries can't be turned off per request
+    and one multiplexed connection per host is opened by the first call.
+    """
+    if _HTTP2_CLIENT is not None:
+        return
+    if cache is not None and all(cache.get(em) is not None for em, _ in accounts):
+        return
+
+    from urllib3.util import Retry, Timeout
+
+    session = _get_session()
+    for url in WARM_UP_URLS:
+        # one attempt only: the shared adapter would otherwise retry with
+        # backoff; safe to swap because no batch threads are running yet
+        adapter = session.get_adapter(url)
+        max_retries = adapter.max_retries
+        adapter.max_retries = Retry(0, read=False)
+        try:
+            session.head(url, timeout=Timeout(total=WARM_UP_TIMEOUT_SECONDS))
+        except Exception as e:
+            log.debug("connection warm-up to %s failed: %s", url, e)
+        finally:
+            adapter.max_retries = max_retries
+
+
+# Every account resolves the same handful of IRCCloud hostnames; keep the
+# answers around instead of doing a fresh getaddrinfo per connection.
+DNS_CACHE_TTL_SECONDS = 300
+
+_getaddrinfo = socket.getaddrinfo
+_DNS_CACHE: Dict[tuple, Tuple[float, list]] = {}
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    hit = _DNS_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return list(hit[1])
+    result = _getaddrinfo(host, port, family, type, proto, flags)
+    _DNS_CACHE[key] = (now + DNS_CACHE_TTL_SECONDS, result)
+    return list(result)
+
+
+def install_dns_cache() -> None:
+    """
+    Route socket.getaddrinfo (used by both requests and websocket-client)
+    through a small TTL cache for the lifetime of the process.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+RATE_LIMIT_RETRIES = 5
+
+# Upper bound for a single 429 wait, whatever Retry-After says
+RATE_LIMIT_MAX_WAIT = 60.0
+
+
 def http_request(
     method: str,
     url: str,
     form: Optional[dict] = None,
     headers: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
 ) -> bytes:
     if headers is None:
         headers = {}
+    if session is None:
+        session = _http_client()
 
     data = form if form is not None else None
 
-    resp = requests.request(method, url, data=data, headers=headers, timeout=20)
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        resp = session.request(method, url, data=data, headers=headers, timeout=20)
+        if resp.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+            break
+        # exponential backoff + jitter, so concurrent accounts don't retry
+        # in lockstep; never sooner than the server's Retry-After
+        wait = 2**attempt + random.uniform(0, 1)
+        try:
+            wait = max(wait, float(resp.headers.get("Retry-After", 0)))
+        except ValueError:
+            pass
+        # clamp the server's value too (it may be huge or "inf")
+        wait = min(RATE_LIMIT_MAX_WAIT, wait)
+        log.warning("429 from %s, retrying in %.1fs", url, wait)
+        time.sleep(wait)
+
     resp.raise_for_status()
     return resp.content
 
 
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    One verified TLS context for every WebSocket connection; left to itself
+    websocket-client builds a new context and reloads the CA store each time.
+
+    Passing a context bypasses websocket-client's own setup, so honour the
+    same env knobs it would: WEBSOCKET_CLIENT_CA_BUNDLE (file or directory,
+    used instead of the system store) and SSLKEYLOGFILE.
+    """
+    cafile = capath = None
+    ca_bundle = os.environ.get("WEBSOCKET_CLIENT_CA_BUNDLE")
+    if ca_bundle and os.path.isfile(ca_bundle):
+        cafile = ca_bundle
+    elif ca_bundle and os.path.isdir(ca_bundle):
+        capath = ca_bundle
+
+    context = ssl.create_default_context(cafile=cafile, capath=capath)
+    keylog_file = os.environ.get("SSLKEYLOGFILE")
+    if keylog_file:
+        context.keylog_filename = keylog_file
+    return context
+
+
+@lru_cache(maxsize=4)
+def _ws_headers(user_agent: str) -> Tuple[str, str]:
+    # only Host varies between connections
+    return ("Origin: https://www.irccloud.com", f"User-Agent: {user_agent}")
+
+
 def ws_client(host: str, path: str, user_agent: str) -> websocket.WebSocket:
-    headers = {
-        "Host": host,
-        "Origin": "https://www.irccloud.com",
-        "User-Agent": user_agent,
-    }
+    import websocket
+
     url = f"wss://{host}{path}"
     ws = websocket.create_connection(
-        url, header=[f"{k}: {v}" for k, v in headers.items()]
+        url,
+        header=[f"Host: {host}", *_ws_headers(user_agent)],
+        sslopt={"context": _ssl_context()},
+        # we send our own Origin header
+        suppress_origin=True,
+        # IRCCloud always sends valid UTF-8 JSON
+        skip_utf8_validation=True,
+        # one send + one recv from a single thread: no need for frame locks
+        enable_multithread=False,
+        timeout=10,
     )
     return ws
 
 
+# ---------------------------------------------------------------------
+# Session cookie cache
+# ---------------------------------------------------------------------
+
+DEFAULT_SESSION_CACHE = "~/.cache/icka/sessions.json"
+
+# IRCCloud cookies live much longer than this; stay conservative
+SESSION_CACHE_TTL_SECONDS = 20 * 3600
+
+
+class SessionCache:
+    """
+    Per-account IRCCloud session cookies, persisted as JSON so later
+    iterations (and later cron runs) can go straight to the WebSocket auth
+    instead of repeating auth-formtoken + /chat/login.
+
+    File layout: {email: [cookie, ws_host, ws_path, expires_at]}
+
+    put/drop only change memory; flush() writes them back, once per batch.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, list] = self._read()
+        # emails changed since the last successful flush
+        self._dirty: Set[str] = set()
+        self._write_failed = False
+
+    def _read(self) -> Dict[str, list]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        # Worker processes (--processes) share the file; serialize their
+        # read-merge-replace so no one's entries get overwritten.
+        try:
+            import fcntl
+        except ImportError:  # no flock (Windows): single process only
+            yield
+            return
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def flush(self) -> None:
+        """
+        Merge this process's changes into the file, touching only the emails
+        it changed. The cache is only an optimisation: write errors are
+        logged and never stop the keep-alive.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+                with self._file_lock():
+                    data = self._read()
+                    for email in self._dirty:
+                        entry = self._entries.get(email)
+                        if entry is None:
+                            data.pop(email, None)
+                        else:
+                            data[email] = entry
+
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        os.chmod(tmp, 0o600)
+                        json.dump(data, f)
+                    os.replace(tmp, self.path)
+            except OSError as e:
+                # warn once, not once per batch (and per worker process);
+                # keep the changes so a later batch can still write them
+                report = log.debug if self._write_failed else log.warning
+                report("could not write session cache %s: %s", self.path, e)
+                self._write_failed = True
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                return
+            self._dirty.clear()
+
+    def get(self, email: str) -> Optional[Tuple[str, str, str]]:
+        with self._lock:
+            entry = self._entries.get(email)
+        # the file is user-editable: treat anything malformed as a miss,
+        # the fresh login that follows overwrites it
+        if not (
+            isinstance(entry, list)
+            and len(entry) == 4
+            and all(isinstance(v, str) for v in entry[:3])
+            and isinstance(entry[3], (int, float))
+        ):
+            return None
+        if entry[3] <= time.time():
+            return None
+        return entry[0], entry[1], entry[2]
+
+    def put(self, email: str, cookie: str, ws_host: str, ws_path: str) -> None:
+        expires_at = time.time() + SESSION_CACHE_TTL_SECONDS
+        with self._lock:
+            self._entries[email] = [cookie, ws_host, ws_path, expires_at]
+            self._dirty.add(email)
+
+    def drop(self, email: str) -> None:
+        with self._lock:
+            if self._entries.pop(email, None) is not None:
+                self._dirty.add(email)
+
+
 # ---------------------------------------------------------------------
 # :D auth flows
 # ---------------------------------------------------------------------
 
 
-def get_auth_token(user_agent: str) -> dict:
+def get_auth_token(
+    user_agent: str, session: Optional[requests.Session] = None
+) -> dict:
     body = http_request(
         "POST",
         "https://api-3.irccloud.com/chat/auth-formtoken",
         form=None,
         headers={"User-Agent": user_agent},
+        session=session,
     )
-    r = json.loads(body.decode("utf-8", errors="replace"))
+    r = _loads(body)
     return r  # expects {"token": "...", "success": true}
 
 
-def get_session(email: str, password: str, token: str, user_agent: str) -> dict:
+def get_session(
+    email: str,
+    password: str,
+    token: str,
+    user_agent: str,
+    session: Optional[requests.Session] = None,
+) -> dict:
     form = {
         "email": email,
         "password": password,
@@ -151,26 +533,52 @@ def get_session(email: str, password: str, token: str, user_agent: str) -> dict:
             "User-Agent": user_agent,
             "X-Auth-FormToken": token,
         },
+        session=session,
     )
-    r = json.loads(body.decode("utf-8", errors="replace"))
+    r = _loads(body)
     return r  # expects SessionResponse-like dict
 
 
+# {"cookie": ..., "_method": "auth", "_reqid": 1}, spliced around the cookie
+_AUTH_PREFIX = '{"cookie":'
+_AUTH_SUFFIX = ',"_method":"auth","_reqid":1}'
+
+# Cookies that already passed a WebSocket auth in this process; only
+# filled when skip_verified is in use, so it can't grow otherwise
+_VERIFIED_COOKIES: Set[str] = set()
+
+
+def ws_auth_skipped(session_cookie: str, skip_verified: bool) -> bool:
+    """True when auth_websocket would trust the cookie without connecting."""
+    return skip_verified and session_cookie in _VERIFIED_COOKIES
+
+
 def auth_websocket(
-    session_cookie: str, host: str, path: str, user_agent: str
+    session_cookie: str,
+    host: str,
+    path: str,
+    user_agent: str,
+    skip_verified: bool = False,
 ) -> bool:
+    """
+    Authenticate session_cookie over the IRCCloud WebSocket.
+
+    With skip_verified, a cookie that already authenticated once in this
+    process is trusted without opening another connection.
+    """
+    if ws_auth_skipped(session_cookie, skip_verified):
+        return True
+
     ws = ws_client(host, path, user_agent)
     try:
-        auth_req = {
-            "cookie": session_cookie,
-            "_method": "auth",
-            "_reqid": 1,
-        }
-        ws.send(json.dumps(auth_req))
+        # fixed frame, only the cookie varies: encode just that string
+        ws.send(_AUTH_PREFIX + _dumps(session_cookie) + _AUTH_SUFFIX)
 
         raw = ws.recv()
-        r = json.loads(raw)
+        r = _loads(raw)
         success = bool(r.get("success", False))
+        if success and skip_verified:
+            _VERIFIED_COOKIES.add(session_cookie)
 
         ws.close()
         return success
@@ -181,11 +589,44 @@ def auth_websocket(
             pass
 
 
-def keep_alive(email: str, password: str, user_agent: str) -> None:
-    log = logging.getLogger("icka")
-
-    log.info("(%s) Getting auth token…", email)
-    token_resp = get_auth_token(user_agent)
+def keep_alive(
+    email: str,
+    password: str,
+    user_agent: str,
+    session: Optional[requests.Session] = None,
+    cache: Optional[SessionCache] = None,
+    skip_ws_verify: bool = False,
+) -> None:
+    t0 = time.monotonic()
+    alog = _AccountLog(log, email)
+    if session is None:
+        session = _http_client()
+
+    cached = cache.get(email) if cache is not None else None
+    if cached is not None:
+        cookie, ws_host, ws_path = cached
+        # make it visible when no keep-alive traffic actually went out
+        how = (
+            "cached, ws skipped"
+            if ws_auth_skipped(cookie, skip_ws_verify)
+            else "cached session ws"
+        )
+        alog.debug("Authenticating via WebSocket with cached session…")
+        try:
+            ok = auth_websocket(
+                cookie, ws_host, ws_path, user_agent, skip_ws_verify
+            )
+        except Exception as e:
+            alog.debug("cached session websocket error: %s", e)
+            ok = False
+        if ok:
+            alog.info("OK in %.2fs (%s)", time.monotonic() - t0, how)
+            return
+        alog.debug("Cached session rejected, logging in again")
+        cache.drop(email)
+
+    alog.debug("Getting auth token…")
+    token_resp = get_auth_token(user_agent, session)
     if not token_resp.get("success"):
         raise RuntimeError("get auth token failed")
 
@@ -193,8 +634,8 @@ def keep_alive(email: str, password: str, user_agent: str) -> None:
     if not token:
         raise RuntimeError("auth token missing in response")
 
-    log.info("(%s) Logging in…", email)
-    session_resp = get_session(email, password, token, user_agent)
+    alog.debug("Logging in…")
+    session_resp = get_session(email, password, token, user_agent, session)
     if not session_resp.get("success"):
         raise RuntimeError("get session failed, check email and password")
 
@@ -202,12 +643,22 @@ def keep_alive(email: str, password: str, user_agent: str) -> None:
     ws_path = session_resp["websocket_path"] + "?exclude_archives=1"
     session_cookie = session_resp["session"]
 
-    log.info("(%s) Authenticating via WebSocket %s%s …", email, ws_host, ws_path)
-    ok = auth_websocket(session_cookie, ws_host, ws_path, user_agent)
+    how = (
+        "token+login, ws skipped"
+        if ws_auth_skipped(session_cookie, skip_ws_verify)
+        else "token+login+ws"
+    )
+    alog.debug("Authenticating via WebSocket %s%s …", ws_host, ws_path)
+    ok = auth_websocket(
+        session_cookie, ws_host, ws_path, user_agent, skip_ws_verify
+    )
     if not ok:
         raise RuntimeError("auth websocket request failed")
 
-    log.info("(%s) Successfully kept connection alive", email)
+    if cache is not None:
+        cache.put(email, session_cookie, ws_host, ws_path)
+
+    alog.info("OK in %.2fs (%s)", time.monotonic() - t0, how)
 
 
 # ---------------------------------------------------------------------
@@ -227,20 +678,24 @@ def load_accounts(
             raise SystemExit(f"accounts file not found: {accounts_file}")
 
         with open(accounts_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if ":" in line:
-                    em, pw = line.split(":", 1)
-                elif "," in line:
-                    em, pw = line.split(",", 1)
-                else:
-                    raise SystemExit(
-                        "invalid line in accounts file "
-                        f"(expected email:password): {line}"
-                    )
-                accounts.append((em.strip(), pw.strip()))
+            data = f.read()
+
+        # not splitlines(): it also breaks on \x0c, \x85, \u2028, ... which
+        # may appear in passwords; text mode already normalised \r\n and \r
+        for line in data.split("\n"):
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            for sep in (":", ","):
+                em, found, pw = line.partition(sep)
+                if found:
+                    break
+            else:
+                raise SystemExit(
+                    "invalid line in accounts file "
+                    f"(expected email:password): {line}"
+                )
+            accounts.append((em.strip(), pw.strip()))
     elif email and password:
         accounts.append((email, password))
 
@@ -254,25 +709,35 @@ def load_accounts(
     return accounts
 
 
+_UNIT_SECS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
 def parse_duration_to_seconds(s: str) -> float:
     """
     Very small Go-like duration parser.
     Supports: '90s', '5m', '1.5h', '2h30m', '1h30m', '1h15m30s', '2h', etc.
     """
-    import re
-
-    pattern = re.compile(r"(\d+(?:\.\d+)?)([smhd])")
     total = 0.0
-    for amount, unit in pattern.findall(s):
-        val = float(amount)
-        if unit == "s":
-            total += val
-        elif unit == "m":
-            total += val * 60
-        elif unit == "h":
-            total += val * 3600
-        elif unit == "d":
-            total += val * 86400
+    n = len(s)
+    i = 0
+    while i < n:
+        if not s[i].isdecimal():
+            i += 1
+            continue
+        j = i + 1
+        while j < n and s[j].isdecimal():
+            j += 1
+        if j + 1 < n and s[j] == "." and s[j + 1].isdecimal():
+            j += 2
+            while j < n and s[j].isdecimal():
+                j += 1
+        unit = _UNIT_SECS.get(s[j]) if j < n else None
+        if unit is None:
+            # like a regex scan: retry from the next character
+            i += 1
+            continue
+        total += float(s[i:j]) * unit
+        i = j + 1
 
     if total == 0.0:
         raise ValueError(f"Could not parse duration: {s}")
@@ -289,9 +754,9 @@ def run_accounts_batched(
     user_agent: str,
     batch_size: int,
     batch_sleep_seconds: int,
+    cache: Optional[SessionCache] = None,
+    skip_ws_verify: bool = False,
 ) -> None:
-    log = logging.getLogger("icka")
-
     total = len(accounts)
     if total == 0:
         return
@@ -306,12 +771,19 @@ def run_accounts_batched(
         batch_sleep_seconds,
     )
 
+    it = iter(accounts)
     batch_index = 0
-    for i in range(0, total, batch_size):
+    end_idx = 0
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            break
         batch_index += 1
-        batch = accounts[i : i + batch_size]
-        start_idx = i + 1
-        end_idx = i + len(batch)
+        # the sleep counts from batch start, so I/O time isn't added on top
+        batch_start = time.monotonic()
+        deadline = batch_start + batch_sleep_seconds
+        start_idx = end_idx + 1
+        end_idx += len(batch)
 
         log.info(
             "Batch %d: accounts %d–%d of %d (size=%d)",
@@ -322,26 +794,156 @@ def run_accounts_batched(
             len(batch),
         )
 
-        for em, pw in batch:
-            try:
-                keep_alive(em, pw, user_agent)
-            except Exception as e:
-                log.error("(%s) keep-alive error: %s", em, e)
+        # All work is network I/O, so run the batch concurrently: a batch
+        # takes roughly as long as its slowest account, not the sum.
+        with ThreadPoolExecutor(max_workers=len(batch)) as ex:
+            futures = {
+                ex.submit(
+                    keep_alive,
+                    em,
+                    pw,
+                    user_agent,
+                    cache=cache,
+                    skip_ws_verify=skip_ws_verify,
+                ): em
+                for em, pw in batch
+            }
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    log.error("(%s) keep-alive error: %s", futures[fut], e)
+
+        if cache is not None:
+            cache.flush()
+
+        now = time.monotonic()
+        log.info(
+            "Batch %d done (%d/%d) in %.2fs",
+            batch_index,
+            end_idx,
+            total,
+            now - batch_start,
+        )
 
         # Sleep before next batch, but not after the last
-        if end_idx < total and batch_sleep_seconds > 0:
-            log.info(
-                "Batch %d done (%d/%d). Sleeping %d seconds before next batch…",
-                batch_index,
-                end_idx,
-                total,
-                batch_sleep_seconds,
-            )
-            time.sleep(batch_sleep_seconds)
+        remaining = deadline - now
+        if end_idx < total and remaining > 0:
+            log.info("Sleeping %.1f seconds before next batch…", remaining)
+            time.sleep(remaining)
 
     log.info("All batches completed (%d accounts).", total)
 
 
+# ---------------------------------------------------------------------
+# Multi-process sharding
+# ---------------------------------------------------------------------
+
+
+def configure_logging(log_level: str) -> None:
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper(), logging.INFO),
+        format="%(asctime)s [%(levelname)s] [icka] %(message)s",
+    )
+
+
+def configure_http(user_agent: str, workers: int, http2: bool) -> None:
+    """
+    Set up this process's HTTP client for `workers` concurrent accounts.
+    """
+    session = _get_session()
+    session.headers["User-Agent"] = user_agent
+
+    # One worker thread per account in a batch share _SESSION; give the pool
+    # a connection per thread so urllib3 doesn't discard sockets under load.
+    if workers > DEFAULT_POOL_MAXSIZE:
+        session.mount("https://", _build_adapter(workers))
+
+    if http2 and not enable_http2(user_agent):
+        log.warning("--http2 requested but httpx[http2] is not installed")
+
+
+def _run_shard(job: tuple) -> None:
+    (
+        shard,
+        accounts,
+        user_agent,
+        batch_size,
+        batch_sleep_seconds,
+        delay,
+        cache_path,
+        skip_ws_verify,
+        http2,
+        log_level,
+    ) = job
+    global _SESSION, _HTTP2_CLIENT
+
+    # forked workers must not share the parent's sockets
+    _SESSION = None
+    _HTTP2_CLIENT = None
+    configure_logging(log_level)
+    install_dns_cache()
+    configure_http(user_agent, batch_size, http2)
+
+    log.info("Shard %d: %d accounts, starting in %.1fs", shard, len(accounts), delay)
+    time.sleep(delay)
+
+    cache = SessionCache(cache_path) if cache_path else None
+    warm_up_connections(accounts, cache)
+    run_accounts_batched(
+        accounts,
+        user_agent,
+        batch_size,
+        batch_sleep_seconds,
+        cache,
+        skip_ws_verify=skip_ws_verify,
+    )
+
+
+def run_accounts_sharded(
+    accounts: List[Tuple[str, str]],
+    user_agent: str,
+    batch_size: int,
+    batch_sleep_seconds: int,
+    processes: int,
+    cache_path: Optional[str],
+    skip_ws_verify: bool,
+    http2: bool,
+    log_level: str,
+) -> None:
+    """
+    Split accounts round-robin across worker processes, each running its
+    own run_accounts_batched. Worker starts are staggered evenly across
+    batch_sleep_seconds so their batches interleave instead of landing
+    together; note the combined login rate still scales with `processes`.
+    """
+    if batch_size <= 0:
+        batch_size = len(accounts)
+    # no point in more processes than there are batches
+    n = max(1, min(processes, -(-len(accounts) // batch_size)))
+    jobs = [
+        (
+            k + 1,
+            accounts[k::n],
+            user_agent,
+            batch_size,
+            batch_sleep_seconds,
+            k * batch_sleep_seconds / n,
+            cache_path,
+            skip_ws_verify,
+            http2,
+            log_level,
+        )
+        for k in range(n)
+    ]
+
+    import multiprocessing
+
+    log.info("Sharding %d accounts across %d processes", len(accounts), n)
+    with multiprocessing.Pool(n) as pool:
+        pool.map(_run_shard, jobs)
+
+
 # ---------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------
@@ -350,6 +952,7 @@ def run_accounts_batched(
 def main() -> None:
     # 1) Load .env first so os.environ is ready
     load_dotenv(".env")
+    install_dns_cache()
 
     parser = argparse.ArgumentParser(
         description="IRCCloud keep-alive (Python, multi-account, .env-aware, batched)"
@@ -389,11 +992,43 @@ def main() -> None:
         type=int,
         default=env_int("BATCH_SLEEP_SECONDS", 300),
         help=(
-            "Sleep in seconds between batches "
+            "Seconds between the starts of consecutive batches "
             "(default from ICKA_BATCH_SLEEP_SECONDS or 300)"
         ),
     )
 
+    parser.add_argument(
+        "--session-cache",
+        default=env_get("SESSION_CACHE", DEFAULT_SESSION_CACHE),
+        help=(
+            "File used to cache session cookies between runs; empty disables "
+            f"(default from ICKA_SESSION_CACHE or {DEFAULT_SESSION_CACHE})"
+        ),
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=env_int("PROCESSES", 1),
+        help=(
+            "Shard accounts across this many worker processes, each running "
+            "its own batches (default from ICKA_PROCESSES or 1)"
+        ),
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 via httpx for the API calls (needs httpx[http2])",
+    )
+    parser.add_argument(
+        "--skip-ws-verify",
+        action="store_true",
+        help=(
+            "Trust session cookies that already passed a WebSocket auth in "
+            "this process instead of re-authenticating (off by default)"
+        ),
+    )
+
     args = parser.parse_args()
 
     # CLI flags OR env vars
@@ -403,16 +1038,16 @@ def main() -> None:
 
     # forever: CLI flag OR ICKA_FOREVER
     args.forever = args.forever or env_bool("FOREVER", default=False)
-
-    logging.basicConfig(
-        level=getattr(logging, args.log_level.upper(), logging.INFO),
-        format="%(asctime)s [%(levelname)s] [icka] %(message)s",
+    args.http2 = args.http2 or env_bool("HTTP2", default=False)
+    args.skip_ws_verify = args.skip_ws_verify or env_bool(
+        "SKIP_WS_VERIFY", default=False
     )
 
+    configure_logging(args.log_level)
+
     accounts = load_accounts(accounts_file, email, password)
     user_agent = args.user_agent
 
-    log = logging.getLogger("icka")
     if accounts_file:
         log.info("Counted %d accounts total from %s", len(accounts), accounts_file)
     else:
@@ -421,9 +1056,44 @@ def main() -> None:
     batch_size = args.batch_size
     batch_sleep_seconds = args.batch_sleep_seconds
 
+    if args.processes > 1:
+        if args.skip_ws_verify:
+            # each iteration runs in a fresh Pool, so nothing is remembered
+            log.warning("--skip-ws-verify has no effect with --processes > 1")
+
+        def run_once() -> None:
+            run_accounts_sharded(
+                accounts,
+                user_agent,
+                batch_size,
+                batch_sleep_seconds,
+                args.processes,
+                args.session_cache,
+                args.skip_ws_verify,
+                args.http2,
+                args.log_level,
+            )
+
+    else:
+        configure_http(
+            user_agent, batch_size if batch_size > 0 else len(accounts), args.http2
+        )
+        cache = SessionCache(args.session_cache) if args.session_cache else None
+        warm_up_connections(accounts, cache)
+
+        def run_once() -> None:
+            run_accounts_batched(
+                accounts,
+                user_agent,
+                batch_size,
+                batch_sleep_seconds,
+                cache,
+                skip_ws_verify=args.skip_ws_verify,
+            )
+
     if not args.forever:
         # One-shot mode (ideal for cron)
-        run_accounts_batched(accounts, user_agent, batch_size, batch_sleep_seconds)
+        run_once()
         return
 
     # Forever mode
@@ -432,15 +1102,15 @@ def main() -> None:
     except ValueError as e:
         raise SystemExit(f"unable to parse --sleep-interval: {e}")
 
-    logging.info(
+    log.info(
         "Running in --forever mode, iteration sleep = %s (%ss)",
         args.sleep_interval,
         sleep_seconds,
     )
 
     while True:
-        run_accounts_batched(accounts, user_agent, batch_size, batch_sleep_seconds)
-        logging.info("Iteration complete, sleeping %.1f seconds…", sleep_seconds)
+        run_once()
+        log.info("Iteration complete, sleeping %.1f seconds…", sleep_seconds)
         time.sleep(sleep_seconds)
 
 